@@ -190,6 +190,8 @@ def any_data(data: Union[str, bytes, io.BytesIO], ext: str) -> VirtualFile:
 MAX_SAFE_INTEGER = 9007199254740991
 MIN_SAFE_INTEGER = -9007199254740991
 BIGINT_KEY = "$bigint"
+# Exact types that sanitize_json_bigint never needs to convert
+_JSON_PASSTHROUGH_TYPES = frozenset({str, bool, type(None)})
 
 
 def is_bigint(value: int | float) -> bool:
@@ -216,6 +218,10 @@ def sanitize_json_bigint(
         return str(key)
 
     def convert_bigint(obj: Any) -> Any:
+        # Most cells are plain strings, bools or nulls; return them before
+        # walking the isinstance chain below
+        if type(obj) in _JSON_PASSTHROUGH_TYPES:
+            return obj
         if isinstance(obj, dict):
             return {convert_key(k): convert_bigint(v) for k, v in obj.items()}  # type: ignore
         elif isinstance(obj, list):
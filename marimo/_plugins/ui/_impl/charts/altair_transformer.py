@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import base64
-from typing import Any, Literal, TypedDict, Union
+import functools
+import os
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypedDict, Union
 
 import narwhals.stable.v2 as nw
 from narwhals.typing import IntoDataFrame
@@ -20,6 +22,9 @@ from marimo._utils.narwhals_utils import (
     make_lazy,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 LOGGER = _loggers.marimo_logger()
 
 Data = Union[dict[Any, Any], IntoDataFrame, nw.DataFrame[Any]]
@@ -60,8 +65,7 @@ def _to_marimo_csv(data: Data, **kwargs: Any) -> _TransformResult:
     returns a VirtualFile URL instead of writing to disk.
     """
     del kwargs
-    data_csv = _data_to_csv_string(data)
-    virtual_file = mo_data.csv(data_csv.encode("utf-8"))
+    virtual_file = mo_data.csv(_data_to_csv_bytes(data))
     return {"url": virtual_file.url, "format": {"type": "csv"}}
 
 
@@ -71,10 +75,11 @@ def _to_marimo_arrow(data: Data, **kwargs: Any) -> _TransformResult:
     """
     del kwargs
     data = _maybe_sanitize_dataframe(data)
-    try:
-        data_arrow = get_table_manager(data).to_arrow_ipc()
-    except NotImplementedError:
+    manager = get_table_manager(data)
+    if not manager.supports_arrow_ipc():
         return _to_marimo_csv(data)
+    try:
+        data_arrow = manager.to_arrow_ipc()
     except Exception as e:
         LOGGER.warning(
             f"Failed to convert data to arrow format, falling back to CSV: {e}"
@@ -90,10 +95,9 @@ def _to_marimo_inline_csv(data: Data, **kwargs: Any) -> _TransformResult:
     inlines the CSV data in the URL.
     """
     del kwargs
-    data_csv = _data_to_csv_string(data)
     url = build_data_url(
         mimetype="text/csv",
-        data=base64.b64encode(data_csv.encode("utf-8")),
+        data=base64.b64encode(_data_to_csv_bytes(data)),
     )
     return {"url": url, "format": {"type": "csv"}}
 
@@ -103,9 +107,13 @@ def _data_to_json_string(data: _DataType) -> str:
     """Return a JSON string representation of the input data"""
     data = _maybe_sanitize_dataframe(data)
 
+    polars_json = _polars_to_json_string(data)
+    if polars_json is not None:
+        return polars_json
+
     tm = get_table_manager_or_none(data)
     if tm:
-        return tm.to_json(ensure_ascii=True).decode("utf-8")
+        return tm.to_json_str(ensure_ascii=True)
 
     raise NotImplementedError(
         "to_marimo_json only works with data expressed as a DataFrame "
@@ -113,38 +121,108 @@ def _data_to_json_string(data: _DataType) -> str:
     )
 
 
-def _data_to_csv_string(data: _DataType) -> str:
-    """Return a CSV string representation of the input data"""
+def _polars_to_json_string(data: Any) -> Optional[str]:
+    """Serialize a sanitized Polars DataFrame with write_json, if possible.
+
+    write_json serializes in Rust, whereas the table manager converts every
+    row to a Python dict first. The output decodes to the same values as
+    the generic path, but is not byte-identical (e.g. non-ASCII values and
+    column names are not escaped). The two only agree for string, boolean, Float64 and integer
+    columns, so this bails out on any other dtype (Float32 is written at
+    single precision), and on integers outside JavaScript's safe range or
+    non-finite floats (which need `sanitize_json_bigint`).
+    Returns None when the generic path should be used.
+    """
+    if not DependencyManager.polars.imported():
+        return None
+
+    import polars as pl
+
+    if not isinstance(data, pl.DataFrame):
+        return None
+
+    floats: list[str] = []
+    numeric: list[str] = []
+    for name, dtype in data.schema.items():
+        if dtype == pl.String or dtype == pl.Boolean:
+            continue
+        if dtype == pl.Float64:
+            floats.append(name)
+            numeric.append(name)
+            continue
+        if (
+            dtype.is_integer()
+            # Use string comparison because pl.Int128 doesn't exist on older versions
+            and str(dtype) not in ("Int128", "UInt128")
+        ):
+            numeric.append(name)
+            continue
+        return None
+
+    exprs: list[pl.Expr] = []
+    if numeric:
+        exprs.extend(
+            [
+                pl.col(numeric).min().name.prefix("min_"),
+                pl.col(numeric).max().name.prefix("max_"),
+            ]
+        )
+    if floats:
+        exprs.append(pl.col(floats).is_nan().any().name.prefix("nan_"))
+
+    if exprs:
+        row = data.select(exprs).row(0)
+        extrema, flags = row[: 2 * len(numeric)], row[2 * len(numeric) :]
+        if any(flags) or any(
+            value is not None and mo_data.is_bigint(value) for value in extrema
+        ):
+            return None
+
+    return data.write_json()
+
+
+def _data_to_csv_bytes(data: _DataType) -> bytes:
+    """Return a UTF-8 encoded CSV representation of the input data"""
     data = _maybe_sanitize_dataframe(data)
-    return get_table_manager(data).to_csv_str()
+    return get_table_manager(data).to_csv()
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_altair_sanitizers() -> tuple[
+    Optional[Callable[[Any], Any]], Optional[Callable[[Any], Any]]
+]:
+    """Look up Altair's dataframe sanitizers once.
+
+    Which sanitizers exist depends on the installed Altair version.
+    """
+    import altair as alt
+
+    return (
+        getattr(alt.utils, "sanitize_pandas_dataframe", None),
+        getattr(alt.utils, "sanitize_narwhals_dataframe", None),
+    )
 
 
 def _maybe_sanitize_dataframe(data: Any) -> Any:
     """Sanitize a pandas or narwhals DataFrame for JSON serialization"""
-    import altair as alt
+    sanitize_pandas, sanitize_narwhals = _resolve_altair_sanitizers()
 
     # First try to sanitize with sanitize_pandas_dataframe
     # because sanitize_narwhals_dataframe on pandas does not
     # produce a correct result.
-    if DependencyManager.pandas.imported():
+    if sanitize_pandas is not None and DependencyManager.pandas.imported():
         import pandas as pd
 
-        if isinstance(
-            data, pd.DataFrame
-        ) and "sanitize_pandas_dataframe" in dir(alt.utils):
-            return alt.utils.sanitize_pandas_dataframe(data)  # type: ignore[attr-defined]
+        if isinstance(data, pd.DataFrame):
+            return sanitize_pandas(data)
 
     # Then try to sanitize with sanitize_narwhals_dataframe
-    if can_narwhalify(data) and "sanitize_narwhals_dataframe" in dir(
-        alt.utils
-    ):
+    if sanitize_narwhals is not None and can_narwhalify(data):
         narwhals_data = nw.from_native(data)
         try:
             import narwhals.stable.v1 as nw1
 
-            res: nw1.DataFrame[Any] = alt.utils.sanitize_narwhals_dataframe(
-                narwhals_data  # type: ignore[arg-type]
-            )
+            res: nw1.DataFrame[Any] = sanitize_narwhals(narwhals_data)
             return res.to_native()  # type: ignore[return-value]
         except Exception as e:
             LOGGER.warning(f"Failed to sanitize narwhals dataframe: {e}")
@@ -179,7 +257,7 @@ def register_transformers() -> None:
     """
     Register custom data transformers for Altair.
 
-    We register a CSV transformer and a JSON transformer. These
+    We register Arrow, CSV and JSON transformers. These
     transformers return a VirtualFile URL instead of writing to disk,
     which is the default behavior of Altair's to_csv and to_json.
 
@@ -191,9 +269,15 @@ def register_transformers() -> None:
     # We keep the previous options, in case the user has set them
     # we don't want to override them.
 
-    # Default to CSV. Due to the columnar nature of CSV, it is more efficient
-    # than JSON for large datasets (~80% smaller file size).
-    alt.data_transformers.register("marimo", _to_marimo_csv)  # type: ignore[arg-type]
+    # Default to Arrow. It is binary and columnar, so it skips formatting
+    # every cell as text, and it falls back to CSV when the data cannot be
+    # converted. CSV is still more efficient than JSON for large datasets
+    # (~80% smaller file size); set MARIMO_ALTAIR_CSV_TRANSFORMER=1 to use
+    # it as the default instead, e.g. for older Vega versions.
+    if os.getenv("MARIMO_ALTAIR_CSV_TRANSFORMER", "false") in ("true", "1"):
+        alt.data_transformers.register("marimo", _to_marimo_csv)  # type: ignore[arg-type]
+    else:
+        alt.data_transformers.register("marimo", _to_marimo_arrow)  # type: ignore[arg-type]
     alt.data_transformers.register("marimo_inline_csv", _to_marimo_inline_csv)  # type: ignore[arg-type]
     alt.data_transformers.register("marimo_json", _to_marimo_json)  # type: ignore[arg-type]
     alt.data_transformers.register("marimo_csv", _to_marimo_csv)  # type: ignore[arg-type]
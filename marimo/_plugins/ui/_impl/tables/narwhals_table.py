@@ -5,6 +5,8 @@ import datetime
 import functools
 import io
 import math
+import weakref
+from enum import Enum
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Literal, Optional, Union, cast
 
@@ -52,6 +54,85 @@ NAN_VALUE = "NaN"
 POSITIVE_INF = str(float("inf"))
 NEGATIVE_INF = str(float("-inf"))
 
+# Search queries without any of these are matched as plain substrings
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# Fast path for get_field_type: maps the concrete dtype class to its field
+# type so most columns resolve with a single dict lookup. Anything not listed
+# here (e.g. dtypes from other narwhals versions) falls back to the slower
+# predicate chain.
+_DTYPE_KIND: dict[type[Any], FieldType] = {
+    nw.String: "string",
+    nw.Categorical: "string",
+    nw.Enum: "string",
+    nw.Boolean: "boolean",
+    nw.Duration: "number",
+    nw.Int8: "integer",
+    nw.Int16: "integer",
+    nw.Int32: "integer",
+    nw.Int64: "integer",
+    nw.Int128: "integer",
+    nw.UInt8: "integer",
+    nw.UInt16: "integer",
+    nw.UInt32: "integer",
+    nw.UInt64: "integer",
+    nw.UInt128: "integer",
+    nw.Time: "time",
+    nw.Date: "date",
+    nw.Datetime: "datetime",
+    nw.Float32: "number",
+    nw.Float64: "number",
+    nw.Decimal: "number",
+}
+
+# Stats values that are already Python builtins and need no unwrapping
+_PY_SCALAR_TYPES = frozenset({int, float, str, bool})
+
+# Percentile stats, computed in the same select as the other column stats
+_QUANTILES: dict[str, float] = {
+    "p5": 0.05,
+    "p25": 0.25,
+    "p75": 0.75,
+    "p95": 0.95,
+}
+
+
+@functools.cache
+def _quantile_support(
+    implementation: nw.Implementation,
+) -> tuple[bool, Literal["nearest", "linear"]]:
+    """Whether a backend supports quantiles, and the interpolation to use."""
+    # As of Oct 2025, pyarrow and ibis do not support quantiles
+    # through narwhals
+    supported = (
+        not implementation.is_pyarrow() and not implementation.is_ibis()
+    )
+    # As of Oct 2025, DuckDB does not support "nearest" interpolation
+    interpolation: Literal["nearest", "linear"] = (
+        "linear" if implementation.is_duckdb() else "nearest"
+    )
+    return supported, interpolation
+
+
+# Cache for NarwhalsTableManager.is_type. Weak keys so dynamically created
+# classes are not kept alive.
+_NARWHALIFIABLE_TYPES: weakref.WeakKeyDictionary[type[Any], bool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _to_primitive(value: Any) -> str | int | float:
+    """Serialize a sample value to a primitive."""
+    if isinstance(value, list):
+        return str([_to_primitive(v) for v in value])
+    elif isinstance(value, dict):
+        return str({k: _to_primitive(v) for k, v in value.items()})
+    elif isinstance(value, Enum):
+        return value.name
+    elif isinstance(value, (float, int)):
+        return value
+    return str(value)
+
 
 class NarwhalsTableManager(
     TableManager[
@@ -66,15 +147,25 @@ class NarwhalsTableManager(
     ) -> NarwhalsTableManager[IntoDataFrameT, IntoLazyFrameT]:
         return NarwhalsTableManager(nw.from_native(data, pass_through=False))
 
-    @cached_property
-    def _collected_frame(self) -> nw.DataFrame[Any]:
-        if is_narwhals_lazyframe(self.data):
-            return self.data.collect()
-        return self.data
+    # Set by `as_frame` once the data has been collected
+    _collected_frame: Optional[nw.DataFrame[Any]] = None
 
     def as_frame(self) -> nw.DataFrame[Any]:
+        if self._collected_frame is None:
+            if is_narwhals_lazyframe(self.data):
+                self._collected_frame = self.data.collect()
+            else:
+                self._collected_frame = self.data
         return self._collected_frame
 
+    @cached_property
+    def _native_namespace(self) -> Any:
+        return nw.get_native_namespace(self.data)
+
+    @cached_property
+    def _native_namespace_name(self) -> str:
+        return str(self._native_namespace.__name__)
+
     def as_lazy_frame(self) -> nw.LazyFrame[Any]:
         if is_narwhals_lazyframe(self.data):
             return self.data
@@ -121,15 +212,29 @@ class NarwhalsTableManager(
             return self
 
         frame = self.as_frame()
-        _data = frame.to_dict(as_series=False).copy()
-        for col in _data.keys():
-            if col in format_mapping:
-                _data[col] = [
-                    format_value(col, x, format_mapping) for x in _data[col]
-                ]
-        return NarwhalsTableManager(
-            nw.from_dict(_data, backend=nw.get_native_namespace(frame))
+        columns = [col for col in frame.columns if col in format_mapping]
+        if not columns:
+            return NarwhalsTableManager(frame)
+
+        # Lazy frames may collect into a different backend (e.g. DuckDB)
+        backend = (
+            self._native_namespace
+            if frame is self.data
+            else nw.get_native_namespace(frame)
         )
+        # Only materialize the formatted columns; the rest are kept as-is
+        formatted = [
+            nw.new_series(
+                col,
+                [
+                    format_value(col, x, format_mapping)
+                    for x in frame.get_column(col).to_list()
+                ],
+                backend=backend,
+            )
+            for col in columns
+        ]
+        return NarwhalsTableManager(frame.with_columns(formatted))
 
     def supports_filters(self) -> bool:
         return True
@@ -141,13 +246,28 @@ class NarwhalsTableManager(
             return self.with_new_data(self.data.head(0))
 
         # Prefer the index column for selections
-        if INDEX_COLUMN_NAME in self.nw_schema.names():
-            # Drop the index column before returning
-            return self.with_new_data(
-                self.data.filter(nw.col(INDEX_COLUMN_NAME).is_in(indices))
+        if INDEX_COLUMN_NAME in self.nw_schema:
+            unique_indices = set(indices)
+            index_col = nw.col(INDEX_COLUMN_NAME)
+            predicate = (
+                index_col == next(iter(unique_indices))
+                if len(unique_indices) == 1
+                else index_col.is_in(list(unique_indices))
             )
+            # Drop the index column before returning
+            return self.with_new_data(self.data.filter(predicate))
 
         df = self.as_frame()
+        start = indices[0]
+        stop = start + len(indices)
+        if (
+            start >= 0
+            # Slices clamp silently; let out-of-range selections raise below
+            and stop <= len(df)
+            and indices == list(range(start, stop))
+        ):
+            # Contiguous selections can be sliced instead of gathered
+            return self.with_new_data(df[start:stop])
         return self.with_new_data(df[indices])
 
     def select_columns(self, columns: list[str]) -> TableManager[Any]:
@@ -159,16 +279,24 @@ class NarwhalsTableManager(
 
         df = self.as_frame()
         if INDEX_COLUMN_NAME in df.columns:
+            # Fetch every requested row with a single filter, then map each
+            # index value to its position in the filtered frame
+            matched: nw.DataFrame[Any] = df.filter(
+                nw.col(INDEX_COLUMN_NAME).is_in({int(row) for row, _ in cells})
+            )
+            positions: dict[int, int] = {}
+            for position, index in enumerate(
+                matched.get_column(INDEX_COLUMN_NAME).to_list()
+            ):
+                positions.setdefault(int(index), position)
+
             selection: list[TableCell] = []
             for row, col in cells:
-                filtered: nw.DataFrame[Any] = df.filter(
-                    nw.col(INDEX_COLUMN_NAME) == int(row)
-                )
-                if filtered.is_empty():
+                pos = positions.get(int(row))
+                if pos is None:
                     continue
-
                 selection.append(
-                    TableCell(row, col, filtered.get_column(col)[0])
+                    TableCell(row, col, matched.get_column(col)[pos])
                 )
 
             return selection
@@ -181,6 +309,17 @@ class NarwhalsTableManager(
     def drop_columns(self, columns: list[str]) -> TableManager[Any]:
         return self.with_new_data(self.data.drop(columns, strict=False))
 
+    def project(self, keep: list[str]) -> TableManager[Any]:
+        """Select exactly `keep`, in order, with a single projection.
+
+        Prefer this over chaining `drop_columns` and `select_columns`, which
+        adds a plan node per call. Returns `self` when `keep` already
+        matches the frame's columns.
+        """
+        if tuple(keep) == tuple(self.nw_schema.names()):
+            return self
+        return self.with_new_data(self.data.select(keep))
+
     def get_row_headers(self) -> FieldTypes:
         return []
 
@@ -188,7 +327,7 @@ class NarwhalsTableManager(
     def calculate_top_k_rows(
         self, column: ColumnName, k: int
     ) -> list[tuple[Any, int]]:
-        if column not in self.get_column_names():
+        if column not in self._column_names:
             raise ValueError(f"Column {column} not found in table.")
 
         frame = self.as_lazy_frame()
@@ -260,7 +399,14 @@ class NarwhalsTableManager(
 
     @staticmethod
     def is_type(value: Any) -> bool:
-        return can_narwhalify(value)
+        # Whether a value can be narwhalified depends only on its type, so
+        # cache the answer rather than re-probing every time a table renders
+        value_type = type(value)
+        result = _NARWHALIFIABLE_TYPES.get(value_type)
+        if result is None:
+            result = can_narwhalify(value)
+            _NARWHALIFIABLE_TYPES[value_type] = result
+        return result
 
     @cached_property
     def nw_schema(self) -> nw.Schema:
@@ -271,6 +417,9 @@ class NarwhalsTableManager(
     ) -> tuple[FieldType, ExternalDataType]:
         dtype = self.nw_schema[column_name]
         dtype_string = str(dtype)
+        kind = _DTYPE_KIND.get(type(dtype))
+        if kind is not None:
+            return (kind, dtype_string)
         if is_narwhals_string_type(dtype):
             return ("string", dtype_string)
         elif dtype == nw.Boolean:
@@ -309,16 +458,24 @@ class NarwhalsTableManager(
 
     def search(self, query: str) -> TableManager[Any]:
         query = query.lower()
+        is_literal = not _REGEX_METACHARACTERS.intersection(query)
+
+        def _matches(column: str) -> nw.Expr:
+            # Cast to string as pandas may fail for certain values
+            as_string = nw.col(column).cast(nw.String)
+            if is_literal:
+                # Plain-text queries skip the case-insensitive regex engine
+                return as_string.str.to_lowercase().str.contains(
+                    query, literal=True
+                )
+            return as_string.str.contains(f"(?i){query}")
 
         expressions: list[Any] = []
         for column, dtype in self.nw_schema.items():
             if column == INDEX_COLUMN_NAME:
                 continue
             if is_narwhals_string_type(dtype):
-                # Cast to string as pandas may fail for certain values
-                expressions.append(
-                    nw.col(column).cast(nw.String).str.contains(f"(?i){query}")
-                )
+                expressions.append(_matches(column))
             elif dtype == nw.List(nw.String):
                 # TODO: Narwhals doesn't support list.contains
                 # expressions.append(
@@ -330,9 +487,7 @@ class NarwhalsTableManager(
                 or is_narwhals_temporal_type(dtype)
                 or dtype == nw.Boolean
             ):
-                expressions.append(
-                    nw.col(column).cast(nw.String).str.contains(f"(?i){query}")
-                )
+                expressions.append(_matches(column))
 
         if not expressions:
             return NarwhalsTableManager(self.data.filter(nw.lit(False)))
@@ -356,17 +511,35 @@ class NarwhalsTableManager(
             # Normalize values to Python builtins
             for field in msgspec.structs.fields(stats):
                 value = getattr(stats, field.name)
-                if value is not None:
+                # Exact type check: numpy scalars subclass int/float
+                if value is not None and type(value) not in _PY_SCALAR_TYPES:
                     setattr(stats, field.name, unwrap_py_scalar(value))
 
         return stats
 
+    def _stats_frame(self) -> nw.LazyFrame[Any]:
+        """The frame to compute column stats on.
+
+        Stats are computed one column at a time, so for lazy data each call
+        would re-run the whole query plan. Once the data has been collected
+        (e.g. to count rows), reuse it, as long as collecting did not switch
+        backends (DuckDB collects to PyArrow, which supports fewer stats).
+        """
+        collected = self._collected_frame
+        if (
+            collected is not None
+            and collected is not self.data
+            and collected.implementation is self.data.implementation
+        ):
+            return collected.lazy()
+        return self.data.lazy()
+
     def _get_stats_internal(self, column: str) -> ColumnStats:
         # If column is not in the dataframe, return empty stats
         if column not in self.nw_schema:
             return ColumnStats()
 
-        frame = self.data.lazy()
+        frame = self._stats_frame()
         col = nw.col(column)
         dtype = self.nw_schema[column]
         units: dict[str, str] = {}
@@ -377,31 +550,22 @@ class NarwhalsTableManager(
             "nulls": col.null_count(),
         }
 
-        # As of Oct 2025, pyarrow and ibis do not support quantiles
-        # through narwhals
-        supports_numeric_quantiles = (
-            not frame.implementation.is_pyarrow()
-            and not frame.implementation.is_ibis()
-        )
-        supports_temporal_quantiles = (
-            not frame.implementation.is_pyarrow()
-            and not frame.implementation.is_ibis()
+        supports_quantiles, quantile_interpolation = _quantile_support(
+            frame.implementation
         )
 
-        quantile_interpolation: Literal["nearest", "linear"] = "nearest"
-        if frame.implementation.is_duckdb():
-            # As of Oct 2025, DuckDB does not support "nearest" interpolation
-            quantile_interpolation = "linear"
+        def quantiles() -> dict[str, nw.Expr]:
+            return {
+                name: col.quantile(q, interpolation=quantile_interpolation)
+                for name, q in _QUANTILES.items()
+            }
 
         if is_narwhals_string_type(dtype):
             exprs["unique"] = col.n_unique()
         elif dtype == nw.Boolean:
-            exprs.update(
-                {
-                    "true": col.sum(),  # type: ignore[dict-item]
-                    "false": nw.len() - col.sum(),  # type: ignore[dict-item]
-                }
-            )
+            # "false" is derived from "total" after collecting, so the
+            # column is only summed once
+            exprs["true"] = col.sum()  # type: ignore[assignment]
         elif (dtype == nw.Date) or is_narwhals_time_type(dtype):
             exprs.update(
                 {
@@ -445,27 +609,16 @@ class NarwhalsTableManager(
                     "max": col.max(),
                 }
             )
-            if supports_temporal_quantiles:
+            if supports_quantiles:
                 exprs.update(
                     {
                         "mean": col.mean(),
                         "median": col.quantile(
                             0.5, interpolation=quantile_interpolation
                         ),
-                        "p5": col.quantile(
-                            0.05, interpolation=quantile_interpolation
-                        ),
-                        "p25": col.quantile(
-                            0.25, interpolation=quantile_interpolation
-                        ),
-                        "p75": col.quantile(
-                            0.75, interpolation=quantile_interpolation
-                        ),
-                        "p95": col.quantile(
-                            0.95, interpolation=quantile_interpolation
-                        ),
                     }
                 )
+                exprs.update(quantiles())
         elif is_narwhals_integer_type(dtype) or dtype.is_numeric():
             exprs.update(
                 {
@@ -477,23 +630,8 @@ class NarwhalsTableManager(
                     "median": col.median(),
                 }
             )
-            if supports_numeric_quantiles:
-                exprs.update(
-                    {
-                        "p5": col.quantile(
-                            0.05, interpolation=quantile_interpolation
-                        ),
-                        "p25": col.quantile(
-                            0.25, interpolation=quantile_interpolation
-                        ),
-                        "p75": col.quantile(
-                            0.75, interpolation=quantile_interpolation
-                        ),
-                        "p95": col.quantile(
-                            0.95, interpolation=quantile_interpolation
-                        ),
-                    }
-                )
+            if supports_quantiles:
+                exprs.update(quantiles())
 
         import warnings
 
@@ -506,6 +644,14 @@ class NarwhalsTableManager(
             )
             stats_dict = stats.collect().rows(named=True)[0]
 
+        if "true" in stats_dict:
+            true_count = stats_dict["true"]
+            stats_dict["false"] = (
+                None
+                if true_count is None
+                else stats_dict["total"] - true_count
+            )
+
         # Maybe add units to the stats
         for key, value in stats_dict.items():
             if key in units:
@@ -671,14 +817,21 @@ class NarwhalsTableManager(
             # narwhals will raise on metadata-only frames
             return None
 
+    @cached_property
+    def _column_names(self) -> tuple[str, ...]:
+        # Cached alongside nw_schema; the wrapped frame is treated as
+        # immutable, so mutating the native frame in place invalidates this.
+        return tuple(
+            name
+            for name in self.nw_schema.names()
+            if name != INDEX_COLUMN_NAME
+        )
+
     def get_num_columns(self) -> int:
-        return len(self.get_column_names())
+        return len(self._column_names)
 
     def get_column_names(self) -> list[str]:
-        column_names = self.nw_schema.names()
-        if INDEX_COLUMN_NAME in column_names:
-            column_names.remove(INDEX_COLUMN_NAME)
-        return column_names
+        return list(self._column_names)
 
     def get_unique_column_values(self, column: str) -> list[str | int | float]:
         frame = self.data.select(nw.col(column))
@@ -700,42 +853,25 @@ class NarwhalsTableManager(
         # Sample 3 values from the column
         SAMPLE_SIZE = 3
         try:
-            from enum import Enum
-
-            def to_primitive(value: Any) -> str | int | float:
-                if isinstance(value, list):
-                    return str([to_primitive(v) for v in value])
-                elif isinstance(value, dict):
-                    return str({k: to_primitive(v) for k, v in value.items()})
-                elif isinstance(value, Enum):
-                    return value.name
-                elif isinstance(value, (float, int)):
-                    return value
-                return str(value)
-
-            if self.data[column].dtype == nw.Datetime:
+            series = self.data[column]
+            dtype = series.dtype
+            # Take the head first so any conversion only touches the sample
+            sample = series.head(SAMPLE_SIZE)
+            if dtype == nw.Datetime:
                 # Drop timezone info for datetime columns
                 # It's ok to drop timezone since these are just sample values
                 # and not used for any calculations
-                values = (
-                    self.data[column]
-                    .dt.replace_time_zone(None)
-                    .head(SAMPLE_SIZE)
-                    .to_list()
-                )
-            else:
-                values = self.data[column].head(SAMPLE_SIZE).to_list()
+                sample = sample.dt.replace_time_zone(None)
+            values = sample.to_list()
             # For non-numeric columns, NaN represents null values
             # (e.g., pandas 3 with StringDtype stores None as NaN)
-            if not self.data[column].dtype.is_numeric():
-                import math
-
+            if not dtype.is_numeric():
                 values = [
                     None if isinstance(v, float) and math.isnan(v) else v
                     for v in values
                 ]
             # Serialize values to primitives
-            return [to_primitive(v) for v in values]
+            return [_to_primitive(v) for v in values]
         except BaseException:
             # Catch-all: some libraries like Polars have bugs and raise
             # BaseExceptions, which shouldn't crash the kernel
@@ -757,7 +893,7 @@ class NarwhalsTableManager(
     def __repr__(self) -> str:
         rows = self.get_num_rows(force=False)
         columns = self.get_num_columns()
-        df_type = str(nw.get_native_namespace(self.data).__name__)
+        df_type = self._native_namespace_name
         if rows is None:
             return f"{df_type}: {columns:,} columns"
         return f"{df_type}: {rows:,} rows x {columns:,} columns"
@@ -237,6 +237,10 @@ class PandasTableManagerFactory(TableManagerFactory):
                 # This provides more specific dtypes like bytes, floating, categorical, etc.
                 return pd.api.types.infer_dtype(self._original_data[column])
 
+            def supports_arrow_ipc(self) -> bool:
+                # to_feather requires pyarrow
+                return DependencyManager.pyarrow.has()
+
             def to_arrow_ipc(self) -> bytes:
                 out = io.BytesIO()
                 try:
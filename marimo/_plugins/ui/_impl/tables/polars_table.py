@@ -1,10 +1,11 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import codecs
 import functools
 import io
 from functools import cached_property
-from typing import Any, Optional, Union
+from typing import Any, Optional, Union, cast
 
 import narwhals.stable.v2 as nw
 
@@ -63,6 +64,9 @@ class PolarsTableManagerFactory(TableManagerFactory):
                     return self._original_data.collect_schema()
                 return self._original_data.schema
 
+            def supports_arrow_ipc(self) -> bool:
+                return True
+
             def to_arrow_ipc(self) -> bytes:
                 out = io.BytesIO()
                 self.collect().write_ipc(out)
@@ -75,13 +79,44 @@ class PolarsTableManagerFactory(TableManagerFactory):
                 format_mapping: Optional[FormatMapping] = None,
                 separator: str | None = None,
             ) -> str:
+                return cast(
+                    str, self._write_csv(None, format_mapping, separator)
+                )
+
+            def to_csv(
+                self,
+                format_mapping: Optional[FormatMapping] = None,
+                encoding: str | None = "utf-8",
+                separator: str | None = None,
+            ) -> bytes:
+                resolved_encoding = encoding or "utf-8"
+                if codecs.lookup(resolved_encoding).name != "utf-8":
+                    return super().to_csv(
+                        format_mapping, resolved_encoding, separator
+                    )
+                # Polars writes UTF-8, so write the bytes directly rather
+                # than decoding to a str and encoding it again
+                out = io.BytesIO()
+                self._write_csv(out, format_mapping, separator)
+                return out.getvalue()
+
+            def _write_csv(
+                self,
+                file: io.BytesIO | None,
+                format_mapping: Optional[FormatMapping],
+                separator: str | None,
+            ) -> str | None:
                 resolved_separator = (
                     separator if separator is not None else ","
                 )
                 _data = self.apply_formatting(format_mapping).collect()
                 try:
-                    return _data.write_csv(separator=resolved_separator)
+                    return _data.write_csv(file, separator=resolved_separator)
                 except pl.exceptions.ComputeError:
+                    if file is not None:
+                        # Discard any partial output before retrying
+                        file.seek(0)
+                        file.truncate()
                     # Likely CSV format does not support nested data or objects
                     # Try to convert columns to json or strings
                     result = _data
@@ -109,7 +144,7 @@ class PolarsTableManagerFactory(TableManagerFactory):
                             result = self._convert_time_to_string(
                                 result, column
                             )
-                    return result.write_csv(separator=resolved_separator)
+                    return result.write_csv(file, separator=resolved_separator)
 
             def to_json_str(
                 self,
@@ -237,17 +272,19 @@ class PolarsTableManagerFactory(TableManagerFactory):
                     return self
 
                 _data = self.collect()
-                for col in _data.columns:
-                    if col in format_mapping:
-                        _data = _data.with_columns(
-                            pl.Series(
-                                col,
-                                [
-                                    format_value(col, x, format_mapping)
-                                    for x in _data[col]
-                                ],
-                            )
-                        )
+                formatted = [
+                    pl.Series(
+                        col,
+                        [
+                            format_value(col, x, format_mapping)
+                            for x in _data[col]
+                        ],
+                    )
+                    for col in _data.columns
+                    if col in format_mapping
+                ]
+                if formatted:
+                    _data = _data.with_columns(formatted)
                 return PolarsTableManager(_data)
 
             @staticmethod
@@ -112,6 +112,9 @@ class TableManager(abc.ABC, Generic[T]):
             resolved_encoding
         )
 
+    def supports_arrow_ipc(self) -> bool:
+        return False
+
     def to_arrow_ipc(self) -> bytes:
         raise NotImplementedError("Arrow format not supported")
 
@@ -17,7 +17,6 @@ from marimo._plugins.ui._impl.tables.table_manager import (
     TableManager,
     TableManagerFactory,
 )
-from marimo._utils.narwhals_utils import can_narwhalify
 
 MANAGERS: list[TableManagerFactory] = [
     PandasTableManagerFactory(),
@@ -45,7 +44,7 @@ def get_table_manager_or_none(data: Any) -> TableManager[Any] | None:
                 return manager(data)
 
     # Fallback to generic NarwhalsTableManager
-    if can_narwhalify(data, eager_only=False):
+    if NarwhalsTableManager.is_type(data):
         return NarwhalsTableManager.from_dataframe(data)
 
     return None
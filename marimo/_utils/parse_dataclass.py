@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import dataclasses
 import datetime
+import functools
+import inspect
 import json
 import sys
 import types
@@ -10,6 +12,7 @@ from enum import Enum
 from typing import (
     Any,
     Literal,
+    NamedTuple,
     Optional,
     TypeVar,
     Union,
@@ -30,116 +33,280 @@ else:
 
 T = TypeVar("T")
 
-_UNION_ORIGINS = (Union, types.UnionType)
+if sys.version_info < (3, 11):
+
+    def _parse_datetime(value: str) -> datetime.datetime:
+        # fromisoformat only accepts a trailing "Z" (as sent by JavaScript's
+        # toISOString) from Python 3.11
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.datetime.fromisoformat(value)
+
+else:
+    _parse_datetime = datetime.datetime.fromisoformat
 
 
+@functools.lru_cache(maxsize=4096)
 def to_snake(string: str) -> str:
     # basic conversion of javascript camel case to snake
     # does not handle contiguous caps
+    # messages reuse a small set of keys, so conversions are memoized
     return "".join(
         ["_" + i.lower() if i.isupper() else i for i in string]
     ).lstrip("_")
 
 
+class _DataclassInfo(NamedTuple):
+    """Per-class data needed to build a dataclass, resolved once."""
+
+    # Field name -> resolved annotation
+    types: dict[str, Any]
+    # Incoming (camelCase or snake_case) key -> field name
+    key_map: dict[str, str]
+    # Constructor parameters that can be passed positionally, in order,
+    # or None if the constructor can't be called positionally
+    positional: Optional[tuple[str, ...]]
+    positional_keys: frozenset[str]
+
+
+def _to_camel(string: str) -> str:
+    head, *rest = string.split("_")
+    return head + "".join(part[:1].upper() + part[1:] for part in rest)
+
+
+@functools.cache
+def _compile_dataclass(cls: type[Any]) -> _DataclassInfo:
+    # Dataclass annotations are static, so everything that only depends on
+    # the class is computed the first time it is parsed
+    # Interned names make the later lookups in `types` pointer comparisons
+    types = {
+        sys.intern(name): annotation
+        for name, annotation in get_type_hints(cls).items()
+    }
+    positional = _positional_parameters(cls, types)
+    key_map: dict[str, str] = {}
+    for name in types:
+        for key in (name, _to_camel(name)):
+            # Only keep keys that to_snake would map to this field
+            if to_snake(key) == name:
+                key_map[key] = name
+    return _DataclassInfo(
+        types=types,
+        key_map=key_map,
+        positional=positional,
+        positional_keys=frozenset(positional or ()),
+    )
+
+
+def _positional_parameters(
+    cls: type[Any], types: dict[str, Any]
+) -> Optional[tuple[str, ...]]:
+    try:
+        parameters = inspect.signature(cls).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    positional: list[str] = []
+    for parameter in parameters:
+        if parameter.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            # Keyword-only or variadic parameters
+            return None
+        positional.append(sys.intern(parameter.name))
+    if not types.keys() >= set(positional):
+        return None
+    return tuple(positional)
+
+
+# type -> whether it is a dataclass
+_IS_DATACLASS: dict[type[Any], bool] = {}
+
+
+def _is_dataclass_type(tp: type[Any]) -> bool:
+    """Cached dataclasses.is_dataclass for classes."""
+    result = _IS_DATACLASS.get(tp)
+    if result is None:
+        result = _IS_DATACLASS[tp] = dataclasses.is_dataclass(tp)
+    return result
+
+
+def _is_dataclass_annotation(cls: Any) -> bool:
+    # Non-class annotations (unions, generic aliases, ...) are never
+    # dataclasses; dataclasses.is_dataclass would check their type
+    return isinstance(cls, type) and _is_dataclass_type(cls)
+
+
+# Primitive annotation -> value types it is built from
+_PRIMITIVES: dict[Any, tuple[type[Any], ...]] = {
+    float: (int, float),
+    int: (int,),
+    str: (str,),
+    bool: (bool,),
+    bytes: (bytes,),
+}
+
+# id(annotation) -> (annotation, origin, args, NewType supertype). The
+# annotation is stored to keep it alive, so its id cannot be reused by
+# another object.
+_TYPE_INFO: dict[int, tuple[Any, Any, tuple[Any, ...], Any]] = {}
+
+
+def _type_info(cls: Any) -> tuple[Any, tuple[Any, ...], Any]:
+    """Cached get_origin(cls), get_args(cls) and NewType supertype.
+
+    The supertype is None unless cls is a NewType, in which case it is the
+    first non-NewType in its chain of supertypes.
+    """
+    info = _TYPE_INFO.get(id(cls))
+    if info is None or info[0] is not cls:
+        supertype = None
+        current = cls
+        while hasattr(current, "__supertype__"):
+            current = supertype = current.__supertype__
+        info = (cls, get_origin(cls), get_args(cls), supertype)
+        _TYPE_INFO[id(cls)] = info
+    return info[1], info[2], info[3]
+
+
+def _may_build(arg_type: Any, value_type: type[Any]) -> bool:
+    """Whether _build_value could accept a value of `value_type` as `arg_type`.
+
+    Only returns False when _build_value is certain to raise, so skipping
+    the variant does not change which union member is picked.
+    """
+    if arg_type is float:
+        return issubclass(value_type, (int, float))
+    if arg_type in (int, str, bool, bytes) or arg_type is type(None):
+        return issubclass(value_type, arg_type)
+    if _is_dataclass_annotation(arg_type):
+        return issubclass(value_type, dict)
+    origin_cls, _, supertype = _type_info(arg_type)
+    if supertype is not None:
+        return _may_build(supertype, value_type)
+    if origin_cls in (list, set):
+        return issubclass(value_type, (tuple, list, set))
+    if origin_cls is tuple:
+        return issubclass(value_type, (tuple, list))
+    if origin_cls is dict:
+        return issubclass(value_type, dict)
+    return True
+
+
+# id(union) -> (union, {type(value): union members to try, in order})
+_UNION_CANDIDATES: dict[int, tuple[Any, dict[type[Any], tuple[Any, ...]]]] = {}
+
+
+def _union_candidates(
+    cls: Any, arg_types: tuple[Any, ...], value_type: type[Any]
+) -> tuple[Any, ...]:
+    entry = _UNION_CANDIDATES.get(id(cls))
+    if entry is None or entry[0] is not cls:
+        entry = (cls, {})
+        _UNION_CANDIDATES[id(cls)] = entry
+    by_type = entry[1]
+    candidates = by_type.get(value_type)
+    if candidates is None:
+        candidates = tuple(
+            arg_type
+            for arg_type in arg_types
+            if _may_build(arg_type, value_type)
+        )
+        by_type[value_type] = candidates
+    return candidates
+
+
 class _DataclassParser:
     def __init__(self, allow_unknown_keys: bool = False):
         self.allow_unknown_keys = allow_unknown_keys
 
     def _build_value(self, value: Any, cls: type[T]) -> T:
+        # Already exactly the target type (e.g. a native str for a str
+        # field), so there is nothing to convert
+        if value.__class__ is cls:
+            return value  # type: ignore[no-any-return]
+
         # Handle basic types
-        if cls is float and isinstance(value, (int, float)):
-            return float(value)  # type: ignore[return-value]
-        if cls is int and isinstance(value, int):
-            return int(value)  # type: ignore[return-value]
-        if cls is str and isinstance(value, str):
-            return str(value)  # type: ignore[return-value]
-        if cls is bool and isinstance(value, bool):
-            return bool(value)  # type: ignore[return-value]
-        if cls is bytes and isinstance(value, bytes):
-            return bytes(value)  # type: ignore[return-value]
+        accepted = _PRIMITIVES.get(cls)
+        if accepted is not None and isinstance(value, accepted):
+            return cls(value)  # type: ignore
 
         # Handle date and datetime types
         if cls is datetime.date and isinstance(value, str):
-            return datetime.datetime.fromisoformat(value).date()  # type: ignore[return-value]
+            return _parse_datetime(value).date()  # type: ignore[return-value]
         if cls is datetime.datetime and isinstance(value, str):
-            return datetime.datetime.fromisoformat(value)  # type: ignore[return-value]
+            return _parse_datetime(value)  # type: ignore[return-value]
 
         if cls is Any:  # type: ignore[comparison-overlap]
             return value  # type: ignore[no-any-return]
 
         # Already a dataclass
-        if dataclasses.is_dataclass(value):
-            return value  # type: ignore[return-value]
+        if _is_dataclass_type(
+            value if isinstance(value, type) else type(value)
+        ):
+            return cast(T, value)
+
+        # Nested dataclasses are the most common non-primitive field
+        if _is_dataclass_annotation(cls):
+            return self.build_dataclass(value, cls)  # type: ignore[return-value]
 
         # Handle container types
         # origin_cls is not None if cls is a container (such as list,
         # tuple, set, ...)
-        origin_cls = get_origin(cls)
+        origin_cls, cls_args, supertype = _type_info(cls)
 
-        # Handle NewType - check if cls has __supertype__ attribute
-        if hasattr(cls, "__supertype__"):
-            # NewType returns its argument at runtime, but we need to validate
-            # against the supertype
-            supertype = cls.__supertype__  # type: ignore
-            return cls(self._build_value(value, supertype))  # type: ignore
+        # Handle NewType. Calling a NewType returns its argument unchanged,
+        # so validating against the (resolved) supertype is enough
+        if supertype is not None:
+            return cast(T, self._build_value(value, supertype))
 
-        # Handle NotRequired type
+        # Handle NotRequired type. typing.get_type_hints already strips it
+        # on Python 3.11+, so this is only reached on 3.10. Optional[T] is
+        # a Union and goes through the narrowed union dispatch below.
         if origin_cls is NotRequired:
-            (arg_type,) = get_args(cls)
+            (arg_type,) = cls_args
             if value is None:
                 return None  # type: ignore[return-value]
             return self._build_value(value, arg_type)  # type: ignore[no-any-return]
 
-        if origin_cls is Optional:
-            (arg_type,) = get_args(cls)
-            if value is None:
-                return None  # type: ignore[return-value]
-            else:
-                return self._build_value(value, arg_type)  # type: ignore # noqa: E501
-        elif origin_cls in (list, set) and isinstance(
-            value, (tuple, list, set)
-        ):
-            (arg_type,) = get_args(cls)
-            return origin_cls(self._build_value(v, arg_type) for v in value)  # type: ignore # noqa: E501
+        if origin_cls in (list, set) and isinstance(value, (tuple, list, set)):
+            (arg_type,) = cls_args
+            items = [self._build_value(v, arg_type) for v in value]
+            return items if origin_cls is list else set(items)  # type: ignore[return-value]
         elif origin_cls is tuple and isinstance(value, (tuple, list)):
-            arg_types = get_args(cls)
+            arg_types = cls_args
             if len(arg_types) == 2 and isinstance(
                 arg_types[1], type(Ellipsis)
             ):
-                return origin_cls(  # type: ignore
-                    self._build_value(v, arg_types[0]) for v in value
+                return tuple(  # type: ignore[return-value]
+                    [self._build_value(v, arg_types[0]) for v in value]
                 )
             else:
-                return origin_cls(  # type: ignore # noqa: E501
-                    self._build_value(v, t)
-                    for v, t in zip(value, arg_types, strict=False)
+                return tuple(  # type: ignore[return-value]
+                    [
+                        self._build_value(v, t)
+                        for v, t in zip(value, arg_types, strict=False)
+                    ]
                 )
         elif origin_cls is dict and isinstance(value, dict):
-            key_type, value_type = get_args(cls)
-            return origin_cls(  # type: ignore[no-any-return]
-                **{
-                    self._build_value(k, key_type): self._build_value(
-                        v, value_type
-                    )
-                    for k, v in value.items()
-                }
-            )
-        elif origin_cls in _UNION_ORIGINS:
-            arg_types = get_args(cls)
-            for arg_type in arg_types:
+            key_type, value_type = cls_args
+            return {  # type: ignore[return-value]
+                self._build_value(k, key_type): self._build_value(
+                    v, value_type
+                )
+                for k, v in value.items()
+            }
+        elif origin_cls is Union or origin_cls is types.UnionType:
+            # Only try the members that can accept this type of value
+            for arg_type in _union_candidates(cls, cls_args, type(value)):
                 try:
                     return self._build_value(value, arg_type)  # type: ignore # noqa: E501
                 # catch expected exceptions when conversion fails
                 except (TypeError, ValueError):
                     continue
-                except:
-                    raise
             raise ValueError(
                 f"Value '{value}' does not fit any type of the union"
             )
         elif origin_cls is Literal:
             # if its a single Literal of an enum, we can just return the enum
-            arg_types = get_args(cls)
+            arg_types = cls_args
             first_arg_type = arg_types[0]
             if (
                 len(arg_types) == 1
@@ -154,8 +321,6 @@ class _DataclassParser:
             return value  # type: ignore[no-any-return]
         elif type(cls) is type(Enum) and issubclass(cls, Enum):
             return cls(value)  # type: ignore[return-value]
-        elif dataclasses.is_dataclass(cls):
-            return self.build_dataclass(value, cls)  # type: ignore[return-value]
 
         if issubclass(cls, msgspec.Struct):
             return _parse_msgspec(
@@ -178,11 +343,34 @@ class _DataclassParser:
                 "value passed to build_dataclass needs to be a dictionary"
             )
 
-        types = get_type_hints(cls)
+        # mypy does not treat an unbounded type[T] as Hashable
+        info = _compile_dataclass(cast(Any, cls))
+        types = info.types
+        key_map = info.key_map
 
+        # Keys without capitals (and no leading "_", skipped below) are
+        # already snake_case, so only unrecognized camelCase keys are converted
         snake_cased_values = {
-            to_snake(k): v for k, v in values.items() if not k.startswith("_")
+            key_map.get(k) or (k if k.islower() else to_snake(k)): v
+            for k, v in values.items()
+            if not k.startswith("_")
         }
+        build_value = self._build_value
+        positional = info.positional
+        if (
+            positional is not None
+            and snake_cased_values.keys() == info.positional_keys
+        ):
+            # Every constructor parameter is given, so pass them
+            # positionally rather than through a kwargs dict. The
+            # parameters are all fields, so there are no unknown keys.
+            return cls(
+                *[
+                    build_value(snake_cased_values[k], types[k])
+                    for k in positional
+                ]
+            )
+
         if (
             not self.allow_unknown_keys
             and not snake_cased_values.keys() <= types.keys()
@@ -195,7 +383,7 @@ class _DataclassParser:
             )
 
         transformed = {
-            k: self._build_value(v, types[k])
+            k: build_value(v, types[k])
             for k, v in snake_cased_values.items()
             if k in types
         }
@@ -203,6 +391,13 @@ class _DataclassParser:
         return cls(**transformed)
 
 
+# The parser only holds the allow_unknown_keys flag, so share one per value
+_PARSERS = {
+    False: _DataclassParser(allow_unknown_keys=False),
+    True: _DataclassParser(allow_unknown_keys=True),
+}
+
+
 def _parse_msgspec(
     value: Union[bytes, str, dict[Any, Any]], *, strict: bool, cls: type[T]
 ) -> T:
@@ -213,6 +408,15 @@ def _parse_msgspec(
     return msgspec.json.decode(value, strict=strict, type=cls)
 
 
+def _decode_json(message: Union[bytes, str]) -> Any:
+    try:
+        return msgspec.json.decode(message)
+    except msgspec.DecodeError:
+        # Fall back to the stdlib for what msgspec rejects (NaN literals,
+        # out-of-range numbers, non UTF-8 bytes), and for its error type
+        return json.loads(message)
+
+
 def parse_raw(
     message: Union[bytes, str, dict[Any, Any]],
     cls: type[T],
@@ -242,9 +446,9 @@ def parse_raw(
     # a tag, but that would require updating the front end.
     if dataclasses.is_dataclass(cls):
         as_dict = (
-            json.loads(message) if not isinstance(message, dict) else message
+            _decode_json(message) if not isinstance(message, dict) else message
         )
-        parser = _DataclassParser(allow_unknown_keys)
+        parser = _PARSERS[bool(allow_unknown_keys)]
         return cast(
             "T",
             parser.build_dataclass(as_dict, cls),
@@ -10,7 +10,7 @@ import pytest
 
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._plugins.ui._impl.charts.altair_transformer import (
-    _data_to_csv_string,
+    _data_to_csv_bytes,
     _data_to_json_string,
     _to_marimo_arrow,
     _to_marimo_csv,
@@ -19,6 +19,7 @@ from marimo._plugins.ui._impl.charts.altair_transformer import (
     register_transformers,
     sanitize_nan_infs,
 )
+from marimo._plugins.ui._impl.tables.utils import get_table_manager
 from tests._data.mocks import DFType, create_dataframes
 
 HAS_DEPS = DependencyManager.pandas.has() and DependencyManager.altair.has()
@@ -92,6 +93,58 @@ def test_data_to_json_string(df: IntoDataFrame):
     assert all(set(item.keys()) == {"A", "B"} for item in parsed)
 
 
+@pytest.mark.skipif(
+    not HAS_DEPS or not DependencyManager.polars.has(),
+    reason="optional dependencies not installed",
+)
+def test_data_to_json_string_polars_fast_path():
+    import polars as pl
+
+    df = pl.DataFrame(
+        {
+            "A": [1, 2, None],
+            "B": ["a", "é", None],
+            "C": [True, False, None],
+            "D": [datetime.date(2023, 1, 1)] * 3,
+            "E": [0.1, 1 / 3, None],
+        }
+    )
+    expected = json.loads(get_table_manager(df).to_json_str())
+    expected = [{**row, "D": "2023-01-01T00:00:00"} for row in expected]
+
+    with patch.object(
+        pl.DataFrame,
+        "write_json",
+        autospec=True,
+        wraps=pl.DataFrame.write_json,
+    ) as write_json:
+        result = _data_to_json_string(df)
+    assert write_json.call_count == 1
+    assert json.loads(result) == expected
+
+    # Frames that write_json would serialize to different values use the
+    # table manager: NaN and single precision floats
+    for fallback in [
+        pl.DataFrame({"A": [1.0, float("nan")], "B": [1, 2]}),
+        pl.DataFrame({"A": [0.1]}, schema={"A": pl.Float32}),
+    ]:
+        with patch.object(
+            pl.DataFrame,
+            "write_json",
+            autospec=True,
+            wraps=pl.DataFrame.write_json,
+        ) as write_json:
+            result = _data_to_json_string(fallback)
+        assert write_json.call_count == 0
+        assert result == get_table_manager(fallback).to_json_str()
+
+    # Ints outside the safe range need the $bigint encoding
+    big = pl.DataFrame({"A": [2**60]})
+    assert json.loads(_data_to_json_string(big)) == [
+        {"A": {"$bigint": str(2**60)}}
+    ]
+
+
 @pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
 @pytest.mark.parametrize(
     "df",
@@ -99,7 +152,7 @@ def test_data_to_json_string(df: IntoDataFrame):
     create_dataframes({"A": [1, 2, 3], "B": ["a", "b", "c"]}),
 )
 def test_data_to_csv_string(df: IntoDataFrame):
-    result = _data_to_csv_string(df)
+    result = _data_to_csv_bytes(df).decode("utf-8")
 
     assert isinstance(result, str)
     lines = result.strip().split("\n")
@@ -107,6 +160,18 @@ def test_data_to_csv_string(df: IntoDataFrame):
     assert lines[0].startswith('"A","B"') or lines[0].startswith("A,B")
 
 
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes({"A": [1, 2, 3], "B": ["a", "b", "c"]}),
+)
+def test_data_to_csv_bytes(df: IntoDataFrame):
+    result = _data_to_csv_bytes(df)
+
+    assert isinstance(result, bytes)
+    assert result.decode("utf-8") == get_table_manager(df).to_csv_str()
+
+
 @pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
 @pytest.mark.parametrize(
     "df",
@@ -202,7 +267,7 @@ def test_data_to_json_string_with_special_characters(
     ),
 )
 def test_data_to_csv_string_with_different_dtypes(df: IntoDataFrame):
-    result = _data_to_csv_string(df)
+    result = _data_to_csv_bytes(df).decode("utf-8")
     assert isinstance(result, str)
 
 
@@ -212,7 +277,7 @@ def test_register_transformers(mock_data_transformers: MagicMock):
     register_transformers()
 
     assert mock_data_transformers.register.call_count == 5
-    mock_data_transformers.register.assert_any_call("marimo", _to_marimo_csv)
+    mock_data_transformers.register.assert_any_call("marimo", _to_marimo_arrow)
     mock_data_transformers.register.assert_any_call(
         "marimo_inline_csv", _to_marimo_inline_csv
     )
@@ -227,6 +292,17 @@ def test_register_transformers(mock_data_transformers: MagicMock):
     )
 
 
+@patch("altair.data_transformers")
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_register_transformers_csv_default(
+    mock_data_transformers: MagicMock, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("MARIMO_ALTAIR_CSV_TRANSFORMER", "1")
+    register_transformers()
+
+    mock_data_transformers.register.assert_any_call("marimo", _to_marimo_csv)
+
+
 SUPPORTS_ARROW_IPC: list[DFType] = ["pandas", "polars", "lazy-polars"]
 
 
@@ -264,6 +340,19 @@ def test_to_marimo_arrow_fallback(df: IntoDataFrame):
     assert result["format"] == {"type": "csv"}
 
 
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_to_marimo_arrow_skips_unsupported_manager():
+    data = {"A": [1, 2, 3]}
+    assert not get_table_manager(data).supports_arrow_ipc()
+
+    with patch(
+        "marimo._plugins.ui._impl.tables.table_manager.TableManager.to_arrow_ipc"
+    ) as to_arrow_ipc:
+        result = _to_marimo_arrow(data)
+    to_arrow_ipc.assert_not_called()
+    assert result["format"] == {"type": "csv"}
+
+
 @pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
 @pytest.mark.parametrize(
     "df",
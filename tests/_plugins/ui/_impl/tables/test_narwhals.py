@@ -190,6 +190,31 @@ class TestNarwhalsTableManagerFactory(unittest.TestCase):
         expected_data = self.data[indices]
         assert_frame_equal(selected_manager.data, expected_data)
 
+    def test_select_rows_contiguous_and_unordered(self) -> None:
+        assert self.manager.select_rows([1, 2]).data["A"].to_list() == [2, 3]
+        assert self.manager.select_rows([2, 0]).data["A"].to_list() == [3, 1]
+
+    def test_select_rows_out_of_range(self) -> None:
+        import polars as pl
+
+        with pytest.raises(pl.exceptions.OutOfBoundsError):
+            self.manager.select_rows([2, 3, 4])
+        with pytest.raises(pl.exceptions.OutOfBoundsError):
+            self.manager.select_rows([5])
+
+    def test_select_rows_with_index_column(self) -> None:
+        import polars as pl
+
+        from marimo._plugins.ui._impl.tables.selection import (
+            INDEX_COLUMN_NAME,
+        )
+
+        manager = NarwhalsTableManager.from_dataframe(
+            pl.DataFrame({INDEX_COLUMN_NAME: [5, 6, 7], "A": [1, 2, 3]})
+        )
+        assert manager.select_rows([6]).data["A"].to_list() == [2]
+        assert manager.select_rows([7, 5, 7]).data["A"].to_list() == [1, 3]
+
     def test_select_rows_empty(self) -> None:
         selected_manager = self.manager.select_rows([])
         assert selected_manager.data.shape == (0, 5)
@@ -219,12 +244,49 @@ class TestNarwhalsTableManagerFactory(unittest.TestCase):
         ]
         assert selected_cells == expected_cells
 
+    def test_select_cells_with_index_column(self) -> None:
+        import polars as pl
+
+        from marimo._plugins.ui._impl.tables.selection import (
+            INDEX_COLUMN_NAME,
+        )
+
+        manager = NarwhalsTableManager.from_dataframe(
+            pl.DataFrame(
+                {
+                    INDEX_COLUMN_NAME: [10, 11, 12],
+                    "A": [1, 2, 3],
+                    "B": ["a", "b", "c"],
+                }
+            )
+        )
+        cells = [
+            TableCoordinate(column_name="B", row_id=12),
+            TableCoordinate(column_name="A", row_id=10),
+            TableCoordinate(column_name="A", row_id=99),
+            TableCoordinate(column_name="B", row_id=10),
+        ]
+        assert manager.select_cells(cells) == [
+            TableCell(column="B", row=12, value="c"),
+            TableCell(column="A", row=10, value=1),
+            TableCell(column="B", row=10, value="a"),
+        ]
+
     def test_drop_columns(self) -> None:
         columns = ["A"]
         dropped_manager = self.manager.drop_columns(columns)
         expected_data = self.data.drop(columns)
         assert_frame_equal(dropped_manager.data, expected_data)
 
+    def test_project(self) -> None:
+        columns = ["C", "A"]
+        projected_manager = self.manager.project(columns)
+        expected_data = self.data.select(columns)
+        assert_frame_equal(projected_manager.data, expected_data)
+
+        # Keeping every column in order is a no-op
+        assert self.manager.project(self.data.columns) is self.manager
+
     def test_get_row_headers(self) -> None:
         expected_headers = []
         assert self.manager.get_row_headers() == expected_headers
@@ -233,6 +295,20 @@ class TestNarwhalsTableManagerFactory(unittest.TestCase):
         assert self.manager.is_type(self.data)
         assert not self.manager.is_type("not a dataframe")
 
+    def test_is_type_is_cached_per_type(self) -> None:
+        from unittest.mock import patch
+
+        import polars as pl
+
+        assert self.manager.is_type(self.data)
+        assert not self.manager.is_type("not a dataframe")
+        with patch(
+            "marimo._plugins.ui._impl.tables.narwhals_table.can_narwhalify"
+        ) as mock_can_narwhalify:
+            assert self.manager.is_type(pl.DataFrame({"x": [1]}))
+            assert not self.manager.is_type("another string")
+        mock_can_narwhalify.assert_not_called()
+
     def test_get_field_types(self) -> None:
         import polars as pl
 
@@ -1021,6 +1097,51 @@ def test_dataframe_with_mixed_types(df: Any) -> None:
     assert manager.get_field_type("A") == ("string", "String")
 
 
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_get_stats_reuses_collected_lazy_frame() -> None:
+    import polars as pl
+
+    runs = 0
+
+    def count_runs(series: pl.Series) -> pl.Series:
+        nonlocal runs
+        runs += 1
+        return series
+
+    lazy = pl.LazyFrame({"A": [1, 2, 3, None]}).with_columns(
+        pl.col("A").map_batches(count_runs, return_dtype=pl.Int64)
+    )
+    before = NarwhalsTableManager.from_dataframe(lazy).get_stats("A")
+
+    manager = NarwhalsTableManager.from_dataframe(lazy)
+    runs = 0
+    # Counting rows collects the lazy frame
+    assert manager.get_num_rows(force=True) == 4
+    assert manager.get_stats("A") == before
+    # The stats are computed without re-running the query plan
+    assert runs == 1
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_get_stats_boolean_with_nulls_single_collect() -> None:
+    from unittest.mock import patch
+
+    import polars as pl
+
+    manager = NarwhalsTableManager.from_dataframe(
+        pl.LazyFrame({"A": [True, False, None]})
+    )
+    with patch.object(
+        nw.LazyFrame,
+        "collect",
+        autospec=True,
+        side_effect=nw.LazyFrame.collect,
+    ) as collect:
+        stats = manager.get_stats("A")
+    assert collect.call_count == 1
+    assert stats == ColumnStats(total=3, nulls=1, true=1, false=2)
+
+
 @pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
 def test_get_summary_all_types() -> None:
     dfs = create_dataframes(
@@ -1390,6 +1511,21 @@ def test_search_with_regex(df: Any) -> None:
     assert result.get_num_rows() == 2
 
 
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes({"A": ["Apple", "banana", "a.b"], "B": [10, 20, 30]}),
+)
+def test_search_literal_is_case_insensitive(df: Any) -> None:
+    manager = NarwhalsTableManager.from_dataframe(df)
+    assert manager.search("APP").get_num_rows() == 1
+    assert manager.search("an").get_num_rows() == 1
+    assert manager.search("2").get_num_rows() == 1
+    # Queries with regex metacharacters are still treated as regex
+    assert manager.search("^b").get_num_rows() == 1
+    assert manager.search("0$").get_num_rows() == 3
+
+
 @pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
 @pytest.mark.parametrize(
     "df",
@@ -1730,6 +1866,24 @@ def test_get_column_names_with_timestamp_columns() -> None:
     }
 
 
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_get_column_names_excludes_index_and_returns_copy() -> None:
+    import polars as pl
+
+    from marimo._plugins.ui._impl.tables.selection import INDEX_COLUMN_NAME
+
+    df = pl.DataFrame({INDEX_COLUMN_NAME: [0, 1], "a": [1, 2], "b": [3, 4]})
+    manager = NarwhalsTableManager.from_dataframe(df)
+
+    column_names = manager.get_column_names()
+    assert column_names == ["a", "b"]
+    assert manager.get_num_columns() == 2
+
+    # Mutating the returned list must not affect the manager
+    column_names.append("c")
+    assert manager.get_column_names() == ["a", "b"]
+
+
 @pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
 def test_get_sample_values_returns_primitives() -> None:
     """Test that get_sample_values always returns primitive types."""
@@ -1809,6 +1963,35 @@ def test_get_field_types_with_many_columns_is_performant(df: Any) -> None:
     )
 
 
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_get_field_types_dtype_widths() -> None:
+    import polars as pl
+
+    df = pl.DataFrame(
+        {
+            "i8": pl.Series([1], dtype=pl.Int8),
+            "u32": pl.Series([1], dtype=pl.UInt32),
+            "f32": pl.Series([1.0], dtype=pl.Float32),
+            "time": [datetime.time(12, 30)],
+            "duration": [datetime.timedelta(days=1)],
+            "date": [datetime.date(2021, 1, 1)],
+            "enum": pl.Series(["a"], dtype=pl.Enum(["a", "b"])),
+        }
+    )
+    manager = NarwhalsTableManager.from_dataframe(df)
+    assert [
+        (name, field_type[0]) for name, field_type in manager.get_field_types()
+    ] == [
+        ("i8", "integer"),
+        ("u32", "integer"),
+        ("f32", "number"),
+        ("time", "time"),
+        ("duration", "number"),
+        ("date", "date"),
+        ("enum", "string"),
+    ]
+
+
 @pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
 @pytest.mark.parametrize(
     "df",
@@ -205,6 +205,21 @@ class TestPolarsTableManagerFactory(unittest.TestCase):
         )
         manager = self.factory.create()(df)
         assert isinstance(manager.to_csv(), bytes)
+        assert manager.to_csv() == manager.to_csv_str().encode("utf-8")
+
+    def test_to_csv_matches_to_csv_str(self) -> None:
+        import polars as pl
+
+        manager = self.factory.create()(
+            pl.DataFrame({"a": [1, 2], "b": ["é", "ü"]})
+        )
+        assert manager.to_csv() == manager.to_csv_str().encode("utf-8")
+        assert manager.to_csv(separator=";") == manager.to_csv_str(
+            separator=";"
+        ).encode("utf-8")
+        assert manager.to_csv(encoding="latin-1") == (
+            manager.to_csv_str().encode("latin-1")
+        )
 
     def test_to_parquet(self) -> None:
         assert isinstance(self.manager.to_parquet(), bytes)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import datetime as dt
 import json
+import math
 import sys
 from dataclasses import dataclass, field
 from enum import Enum
@@ -955,3 +956,142 @@ def test_dataclass_with_nested_msgspec_struct() -> None:
     # Test as dict
     parsed = parse_raw(data, Nested, allow_unknown_keys=True)
     assert parsed == Nested(config=StructClass(limit=10))
+
+
+def test_type_hints_resolved_once_per_class() -> None:
+    from unittest.mock import patch
+
+    from marimo._utils import parse_dataclass
+
+    @dataclass
+    class Point:
+        x: int
+        y: int
+
+    with patch.object(
+        parse_dataclass,
+        "get_type_hints",
+        wraps=parse_dataclass.get_type_hints,
+    ) as get_type_hints:
+        for i in range(3):
+            assert parse_raw({"x": i, "y": i}, Point) == Point(x=i, y=i)
+    assert get_type_hints.call_count == 1
+
+
+def test_parse_raw_json_edge_cases() -> None:
+    @dataclass
+    class Number:
+        value: float
+
+    # Literals and numbers the stdlib accepts are still parsed
+    assert math.isnan(parse_raw(b'{"value": NaN}', Number).value)
+    assert parse_raw('{"value": 1e400}', Number).value == float("inf")
+    assert parse_raw('{"value": 1.5}', Number) == Number(value=1.5)
+
+
+def test_union_member_order_by_value_type() -> None:
+    @dataclass
+    class Values:
+        number: Union[float, int]
+        flag: Union[int, bool]
+        mixed: list[Union[Config, list[int], dict[str, int], str, None]]
+
+    parsed = parse_raw(
+        {
+            "number": 1,
+            "flag": True,
+            "mixed": [
+                {"disabled": True, "gpu": False},
+                [1, 2],
+                {"a": 1},
+                "text",
+                None,
+            ],
+        },
+        Values,
+    )
+    assert parsed == Values(
+        number=1.0,
+        flag=1,
+        mixed=[
+            Config(disabled=True, gpu=False),
+            [1, 2],
+            {"a": 1},
+            "text",
+            None,
+        ],
+    )
+    assert isinstance(parsed.number, float)
+
+    with pytest.raises(ValueError, match="does not fit any type of the union"):
+        parse_raw({"number": "1", "flag": 1, "mixed": []}, Values)
+
+
+def test_positional_and_keyword_construction() -> None:
+    @dataclass
+    class WithDefault:
+        first: int
+        second: str = "default"
+
+    @dataclass(kw_only=True)
+    class KeywordOnly:
+        first: int
+        second: str = "default"
+
+    for cls in (WithDefault, KeywordOnly):
+        assert parse_raw({"first": 1, "second": "x"}, cls) == cls(
+            first=1, second="x"
+        )
+        assert parse_raw({"first": 1}, cls) == cls(first=1)
+        with pytest.raises(TypeError):
+            parse_raw({}, cls)
+
+
+def test_datetime_with_utc_designator() -> None:
+    @dataclass
+    class Event:
+        at: dt.datetime
+        on: dt.date
+
+    parsed = parse_raw(
+        {"at": "2024-01-02T03:04:05.678Z", "on": "2024-01-02T00:00:00Z"},
+        Event,
+    )
+    assert parsed == Event(
+        at=dt.datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=dt.timezone.utc),
+        on=dt.date(2024, 1, 2),
+    )
+
+
+def test_values_already_of_target_type() -> None:
+    @dataclass
+    class Prebuilt:
+        name: str
+        ratio: float
+        config: StructClass
+
+    config = StructClass(limit=10)
+    parsed = parse_raw({"name": "a", "ratio": 1, "config": config}, Prebuilt)
+    assert parsed == Prebuilt(name="a", ratio=1.0, config=config)
+    assert parsed.config is config
+    assert isinstance(parsed.ratio, float)
+
+
+def test_nested_newtype() -> None:
+    UserId = NewType("UserId", str)
+    AdminId = NewType("AdminId", UserId)
+    # Make AdminId available in globals for forward reference resolution
+    globals()["AdminId"] = AdminId
+
+    @dataclass
+    class Admin:
+        id: AdminId
+        backup: Union[int, AdminId]
+
+    parsed = parse_raw({"id": "a", "backup": "b"}, Admin)
+    assert parsed == Admin(
+        id=AdminId(UserId("a")), backup=AdminId(UserId("b"))
+    )
+
+    with pytest.raises(ValueError):
+        parse_raw({"id": 1, "backup": "b"}, Admin)